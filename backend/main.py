@@ -1,10 +1,39 @@
 from __future__ import annotations
 
-from fastapi import FastAPI, HTTPException, Query
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Tuple
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple
+from async_lru import alru_cache
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from difflib import get_close_matches
 from google_play_scraper import search
+import asyncio
+import functools
+import hashlib
 import logging
+import orjson
+import os
+import re
+import sys
+import threading
+
+# Scraper payload keys, interned once so per-app dict lookups hit the identity fast path
+(
+    _K_TITLE,
+    _K_SCORE,
+    _K_APPID,
+    _K_INSTALLS,
+    _K_DEV,
+    _K_SUMMARY,
+    _K_DESC,
+    _K_REVIEWS,
+    _K_URL,
+) = map(sys.intern, (
+    'title', 'score', 'appId', 'installs', 'developer', 'summary', 'description', 'reviews', 'url'
+))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -66,30 +95,80 @@ GAME_CATEGORY_QUERIES = {
 
 CATEGORY_QUERIES = {**APP_CATEGORY_QUERIES, **GAME_CATEGORY_QUERIES}
 
+# Precomputed lookups for category validation and suggestions
+_CATEGORY_KEYS_TUPLE = tuple(CATEGORY_QUERIES)
+_CATEGORY_KEY_SET = frozenset(CATEGORY_QUERIES)
+_CATEGORY_KEYS_LIST_10 = _CATEGORY_KEYS_TUPLE[:10]
+
 PER_KEYWORD_HITS = 200
 
+_APP_URL_PREFIX = "https://play.google.com/store/apps/details?id="
+
+# Identical searches within this window are served from memory instead of the Play Store
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "300"))
+_search_cache: TTLCache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+_search_cache_lock = threading.Lock()
+
+# Whole /scrape responses are reused for this window per (category, limit, filter)
+SCRAPE_CACHE_TTL = int(os.getenv("SCRAPE_CACHE_TTL", "120"))
+
+
+_VARIANT_TEMPLATES = (
+    "{r} apps",
+    "best {r} apps",
+    "popular {r} apps",
+    "top {r} android apps",
+    "{r} app download",
+)
 
-def _build_category_keywords() -> Dict[str, List[str]]:
+
+def _build_category_keywords() -> Mapping[str, Tuple[str, ...]]:
     """Generate multiple keyword variations per category for broader coverage."""
-    keywords: Dict[str, List[str]] = {}
+    keywords: Dict[str, Tuple[str, ...]] = {}
     for category, base_phrase in CATEGORY_QUERIES.items():
         readable = category.replace("_", " ")
-        variants = [
-            base_phrase,
-            f"{readable} apps",
-            f"best {readable} apps",
-            f"popular {readable} apps",
-            f"top {readable} android apps",
-            f"{readable} app download",
-        ]
+        variants = [base_phrase] + [template.format(r=readable) for template in _VARIANT_TEMPLATES]
         # Remove duplicates while preserving order
-        unique_variants = list(dict.fromkeys(variant for variant in variants if variant))
-        keywords[category] = unique_variants
-    return keywords
+        keywords[category] = tuple(dict.fromkeys(variants))
+    # Read-only view so the hashable keyword tuples can't drift at runtime
+    return MappingProxyType(keywords)
 
 
 CATEGORY_KEYWORDS = _build_category_keywords()
 
+# Keyword searches allowed in flight at once for a single category scrape; the default
+# runs every keyword of a category in one wave. Clamped to at least 1: a zero-slot
+# semaphore would block every scrape forever, and a negative one can't be built
+SEARCH_CONCURRENCY = max(
+    1, int(os.getenv("SEARCH_CONCURRENCY", str(max(map(len, CATEGORY_KEYWORDS.values())))))
+)
+
+# Dedicated threads for the blocking search() calls. asyncio's default executor has
+# only cpu_count + 4 workers, which on small hosts splits even one scrape into waves
+_SEARCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(32, SEARCH_CONCURRENCY),
+    thread_name_prefix="play-search",
+)
+
+
+def _search_cached(query: str, n_hits: int, lang: str, country: str):
+    """Call google_play_scraper.search, reusing results cached within SEARCH_CACHE_TTL."""
+    key = (query, n_hits, lang, country)
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Fetch outside the lock so concurrent keyword searches are not serialized
+    results = search(query=query, n_hits=n_hits, lang=lang, country=country)
+    with _search_cache_lock:
+        _search_cache[key] = results
+    return results
+
+
+_INT_RE = re.compile(r"^\s*([\d.]+)\s*([kmb]?)\+?\s*$", re.I)
+_MULT = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
 
 def _parse_int(value: Optional[object]) -> Optional[int]:
     """Parse various Play Store numeric strings (e.g., '10,000+', '1.5M') into ints."""
@@ -100,76 +179,133 @@ def _parse_int(value: Optional[object]) -> Optional[int]:
     if isinstance(value, (int, float)):
         return int(value)
     if isinstance(value, str):
-        normalized = value.strip().lower().replace(",", "")
-        multiplier = 1
-        if normalized.endswith("+"):
-            normalized = normalized[:-1]
-        if normalized.endswith("m"):
-            multiplier = 1_000_000
-            normalized = normalized[:-1]
-        elif normalized.endswith("k"):
-            multiplier = 1_000
-            normalized = normalized[:-1]
-        normalized = normalized.strip()
-        if not normalized:
+        match = _INT_RE.match(value.replace(",", ""))
+        if not match:
             return None
         try:
-            return int(float(normalized) * multiplier)
+            return int(float(match.group(1)) * _MULT[match.group(2).lower()])
         except ValueError:
             return None
     return None
 
 
-def _gather_category_results(category: str) -> Tuple[List[dict], List[dict]]:
-    """Run multi-keyword searches for a category and return raw plus deduped entries."""
-    keywords = CATEGORY_KEYWORDS.get(category, [])
-    raw_results: List[dict] = []
-    deduped: Dict[str, dict] = {}
+def _is_underperforming(app_data: dict) -> bool:
+    """Keep apps with a known rating below 4.0."""
+    score = app_data.get(_K_SCORE)
+    return score is not None and score < 4.0
 
-    for keyword in keywords:
-        try:
+
+async def _gather_category_results(
+    category: str,
+    filter_fn: Optional[Callable[[dict], bool]],
+    limit: int,
+) -> Tuple[int, int, List[AppInfo]]:
+    """Run multi-keyword searches concurrently and dedup, filter and convert in one pass.
+
+    Results are merged in keyword order until ``limit`` apps have been built. Every
+    search starts at once by default; only with SEARCH_CONCURRENCY below the keyword
+    count are the searches not yet started skipped when the limit is reached.
+    Returns the raw hit count and unique app count of the results merged before the
+    limit was reached, and up to ``limit`` AppInfo rows.
+    Raises a 502 HTTPException when every keyword search failed, so an upstream
+    outage is never returned (or cached) as an empty result.
+    """
+    keywords = CATEGORY_KEYWORDS.get(category, ())
+    seen: Set[str] = set()
+    raw_count = 0
+    failed_count = 0
+    apps_payload: List[AppInfo] = []
+    semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+
+    async def run_search(keyword: str):
+        # With SEARCH_CONCURRENCY below the keyword count, tasks still waiting here when
+        # the fan-out is cancelled never hit the network
+        async with semaphore:
             logger.info("[SCRAPE] category=%s keyword='%s'", category, keyword)
-            search_results = search(
-                query=keyword,
-                n_hits=PER_KEYWORD_HITS,
-                lang="en",
-                country="us"
-            )
-        except Exception as exc:
-            logger.warning("[SCRAPE_ERROR] keyword='%s' error=%s", keyword, exc)
-            continue
-
-        if isinstance(search_results, dict) and "apps" in search_results:
-            apps_batch = search_results.get("apps", [])
-        elif isinstance(search_results, list):
-            apps_batch = search_results
-        else:
-            apps_batch = []
+            try:
+                # search() is a blocking HTTP round trip, so run it in a worker thread
+                return keyword, await asyncio.get_running_loop().run_in_executor(
+                    _SEARCH_EXECUTOR,
+                    functools.partial(
+                        _search_cached,
+                        query=keyword,
+                        n_hits=PER_KEYWORD_HITS,
+                        lang="en",
+                        country="us"
+                    )
+                )
+            except Exception as exc:
+                return keyword, exc
 
-        raw_results.extend(apps_batch)
-        for app_data in apps_batch:
-            app_id = app_data.get("appId")
-            if not app_id or app_id in deduped:
+    tasks = [asyncio.create_task(run_search(keyword)) for keyword in keywords]
+    try:
+        # Searches run concurrently but merge in keyword order, so the app order
+        # (and the cached response) does not depend on network timing
+        for task in tasks:
+            keyword, search_results = await task
+            if isinstance(search_results, Exception):
+                logger.warning("[SCRAPE_ERROR] keyword='%s' error=%s", keyword, search_results)
+                failed_count += 1
                 continue
-            deduped[app_id] = app_data
 
-    return raw_results, list(deduped.values())
+            if isinstance(search_results, dict) and "apps" in search_results:
+                apps_batch = search_results.get("apps", [])
+            elif isinstance(search_results, list):
+                apps_batch = search_results
+            else:
+                apps_batch = []
+
+            raw_count += len(apps_batch)
+            for app_data in apps_batch:
+                app_id = app_data.get(_K_APPID)
+                if not app_id or app_id in seen:
+                    continue
+                seen.add(app_id)
+
+                # Keep counting the rest of this batch once the limit is reached
+                if len(apps_payload) >= limit:
+                    continue
+                if filter_fn is not None and not filter_fn(app_data):
+                    continue
+                app_info = _to_app_info(app_data)
+                if app_info:
+                    apps_payload.append(app_info)
+
+            if len(apps_payload) >= limit:
+                break
+    finally:
+        # Searches already running in threads finish in the background and still fill the cache
+        for task in tasks:
+            task.cancel()
+
+    if tasks and failed_count == len(tasks):
+        raise HTTPException(
+            status_code=502,
+            detail={
+                "error": "All Play Store searches failed",
+                "category": category
+            }
+        )
+
+    return raw_count, len(seen), apps_payload
 
 
 def _to_app_info(app_data: dict) -> Optional[AppInfo]:
     """Convert raw scraper payload into AppInfo if possible."""
-    app_url = app_data.get('url')
+    d = app_data.get
+    app_url = d(_K_URL) or (
+        f"{_APP_URL_PREFIX}{app_id}" if (app_id := d(_K_APPID)) else None
+    )
     if not app_url:
-        app_id_for_url = app_data.get('appId')
-        if not app_id_for_url:
-            return None
-        app_url = f"https://play.google.com/store/apps/details?id={app_id_for_url}"
+        return None
 
-    return AppInfo(
-        name=app_data.get('title', 'N/A'),
-        rating=app_data.get('score'),
-        reviews=_parse_int(app_data.get('reviews')),
-        min_installs=_parse_int(app_data.get('installs')),
+    # model_construct skips validation, so required fields must be coalesced here:
+    # the scraper can send "title": None, which a .get default does not catch
+    return AppInfo.model_construct(
+        name=d(_K_TITLE) or 'N/A',
+        rating=d(_K_SCORE),
+        reviews=_parse_int(d(_K_REVIEWS)),
+        min_installs=_parse_int(d(_K_INSTALLS)),
         url=app_url
     )
 
@@ -178,6 +314,7 @@ app_instance = FastAPI(
     title="US Play Store Scraper API",
     description="Professional API to scrape apps and games from the US Google Play Store",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -190,16 +327,14 @@ class AppInfo(BaseModel):
     min_installs: Optional[int] = Field(None, alias="minInstalls", description="Minimum installs count")
     url: str = Field(..., description="Direct Google Play URL")
 
-    class Config:
-        allow_population_by_field_name = True
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ScrapeResponse(BaseModel):
     """Response model for scrape endpoint"""
     category: str = Field(..., description="Requested category")
-    total_raw_collected: int = Field(..., description="Total apps collected across all keywords")
-    total_unique_after_dedup: int = Field(..., description="Unique apps after deduplication")
+    total_raw_collected: int = Field(..., description="Total apps in the keyword results merged before the limit was reached")
+    total_unique_after_dedup: int = Field(..., description="Unique apps among the merged results after deduplication")
     total_returned: int = Field(..., description="Apps returned after optional filtering and limiting")
     apps: List[AppInfo] = Field(..., description="List of returned apps")
 
@@ -219,8 +354,7 @@ class DeepScanAppInfo(BaseModel):
     description: Optional[str] = Field(None, description="App description")
     installs: Optional[str] = Field(None, description="Number of installs")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class DeepScanResponse(BaseModel):
@@ -231,39 +365,117 @@ class DeepScanResponse(BaseModel):
     apps: List[DeepScanAppInfo] = Field(..., description="List of low-rated apps")
 
 
+# Static payloads never change at runtime, so build them once at import
+_APP_CATEGORIES_SORTED = tuple(sorted(APP_CATEGORY_QUERIES))
+_GAME_CATEGORIES_SORTED = tuple(sorted(GAME_CATEGORY_QUERIES))
+
+_ROOT_RESPONSE = {
+    "message": "Welcome to US Play Store Scraper API",
+    "description": "Scrape apps and games from the Google Play Store",
+    "endpoints": {
+        "documentation": "/docs",
+        "scrape": "/scrape/{category_name}",
+        "health_check": "/health"
+    },
+    "instructions": "Visit /docs for interactive documentation and a complete list of all available categories",
+    "example_usage": "/scrape/action (for action games) or /scrape/productivity (for productivity apps)"
+}
+
+_HEALTH_RESPONSE = {"status": "healthy", "service": "US Play Store Scraper API"}
+
+_CATEGORIES_RESPONSE = {
+    "total_categories": len(CATEGORY_QUERIES),
+    "app_categories": {
+        "count": len(_APP_CATEGORIES_SORTED),
+        "categories": _APP_CATEGORIES_SORTED
+    },
+    "game_categories": {
+        "count": len(_GAME_CATEGORIES_SORTED),
+        "categories": _GAME_CATEGORIES_SORTED
+    },
+    "usage": "Use these category names in /scrape/{category_name} endpoint"
+}
+
+
+def _prebuild(payload: dict) -> Tuple[bytes, str]:
+    """Serialize a static payload once and derive a strong ETag from its bytes."""
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+_ROOT_BODY, _ROOT_ETAG = _prebuild(_ROOT_RESPONSE)
+_HEALTH_BODY, _HEALTH_ETAG = _prebuild(_HEALTH_RESPONSE)
+_CATEGORIES_BODY, _CATEGORIES_ETAG = _prebuild(_CATEGORIES_RESPONSE)
+
+
+def _static_response(request: Request, body: bytes, etag: str) -> Response:
+    """Answer with the prebuilt body, or 304 if the client already holds this ETag."""
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
 @app_instance.get("/", tags=["Root"])
-async def root():
+async def root(request: Request):
     """
     Welcome endpoint with instructions
     """
-    return {
-        "message": "Welcome to US Play Store Scraper API",
-        "description": "Scrape apps and games from the Google Play Store",
-        "endpoints": {
-            "documentation": "/docs",
-            "scrape": "/scrape/{category_name}",
-            "health_check": "/health"
-        },
-        "instructions": "Visit /docs for interactive documentation and a complete list of all available categories",
-        "example_usage": "/scrape/action (for action games) or /scrape/productivity (for productivity apps)"
-    }
+    return _static_response(request, _ROOT_BODY, _ROOT_ETAG)
 
 
 @app_instance.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """
     Health check endpoint
     """
-    return {"status": "healthy", "service": "US Play Store Scraper API"}
+    return _static_response(request, _HEALTH_BODY, _HEALTH_ETAG)
+
+
+# Headers-only liveness probe; kept out of the schema so it gets no duplicate operation ID
+@app_instance.head("/health", include_in_schema=False)
+async def health_check_head(request: Request):
+    """
+    Health check endpoint for HEAD requests
+    """
+    return _static_response(request, _HEALTH_BODY, _HEALTH_ETAG)
+
+
+@alru_cache(maxsize=256, ttl=SCRAPE_CACHE_TTL)
+async def _scrape_impl(category: str, limit: int, underperforming_only: bool) -> ScrapeResponse:
+    """Build the scrape response for a validated category; repeat calls hit the cache."""
+    total_raw_collected, total_unique_after_dedup, apps_payload = await _gather_category_results(
+        category,
+        filter_fn=_is_underperforming if underperforming_only else None,
+        limit=limit,
+    )
+
+    logger.info(
+        "[SCRAPE_DONE] category=%s raw=%s unique=%s returned=%s",
+        category,
+        total_raw_collected,
+        total_unique_after_dedup,
+        len(apps_payload)
+    )
+
+    return ScrapeResponse(
+        category=category,
+        total_raw_collected=total_raw_collected,
+        total_unique_after_dedup=total_unique_after_dedup,
+        total_returned=len(apps_payload),
+        apps=apps_payload
+    )
 
 
 @app_instance.get(
     "/scrape/{category_name}",
     response_model=ScrapeResponse,
+    response_model_by_alias=True,
+    response_model_exclude_none=True,
     tags=["Scraping"],
     responses={
         200: {"description": "Successfully scraped apps"},
-        400: {"description": "Invalid category", "model": ErrorResponse}
+        400: {"description": "Invalid category", "model": ErrorResponse},
+        502: {"description": "Every Play Store search for the category failed"}
     }
 )
 async def scrape_category(
@@ -280,16 +492,17 @@ async def scrape_category(
     **Features:**
     - Always queries the US Play Store (`country='us'`, `lang='en'`)
     - Executes multiple search queries per category and merges the results
+    - Stops merging further keyword results once `limit` apps have been collected
     - Each keyword search uses `n_hits=200`, `lang='en'`, `country='us'`
     - Deduplicates apps via `appId` before optional filtering
     - Optional filter `underperforming_only=true` keeps apps with rating < 4.0
-    - Returns clean metadata (name, rating, reviews, min_installs, url)
+    - Returns clean metadata (name, rating, reviews, min_installs, url); fields with no value are omitted
     
     **Parameters:**
     - **category_name**: Category key defined in `CATEGORY_QUERIES`
     
     **Returns:**
-    - Transparent counts for raw collected, deduped, and returned apps
+    - Counts of raw collected and deduped apps across the results merged before the limit was reached, plus returned apps
     - Optional filtering for underperforming apps (rating < 4.0)
     - Limit applied after deduplication and filtering
     """
@@ -298,61 +511,27 @@ async def scrape_category(
     normalized_category = category_name.lower().replace(" ", "_")
     
     # Check if category exists in mapping
-    if normalized_category not in CATEGORY_QUERIES:
+    if normalized_category not in _CATEGORY_KEY_SET:
         # Get suggested categories (similar matches)
-        suggestions = [cat for cat in CATEGORY_QUERIES.keys() 
-                      if normalized_category[:3] in cat or cat.startswith(normalized_category[:2])][:5]
+        suggestions = get_close_matches(normalized_category, _CATEGORY_KEYS_TUPLE, n=5, cutoff=0.4)
         
         raise HTTPException(
             status_code=400,
             detail={
                 "error": f"Category '{category_name}' not found",
-                "suggested_categories": suggestions if suggestions else list(CATEGORY_QUERIES.keys())[:10],
+                "suggested_categories": suggestions if suggestions else _CATEGORY_KEYS_LIST_10,
                 "available_categories_count": len(CATEGORY_QUERIES),
                 "visit_docs": "Check /docs for the complete list of categories"
             }
         )
     
     try:
-        raw_results, unique_results = _gather_category_results(normalized_category)
-        total_raw_collected = len(raw_results)
-        total_unique_after_dedup = len(unique_results)
-
-        if underperforming_only:
-            candidate_results = [
-                app for app in unique_results
-                if app.get('score') is not None and app.get('score') < 4.0
-            ]
-        else:
-            candidate_results = unique_results
-
-        apps_payload: List[AppInfo] = []
-        for app_data in candidate_results:
-            app_info = _to_app_info(app_data)
-            if not app_info:
-                continue
-            apps_payload.append(app_info)
-            if len(apps_payload) >= limit:
-                break
-
-        logger.info(
-            "[SCRAPE_DONE] category=%s raw=%s unique=%s returned=%s",
-            normalized_category,
-            total_raw_collected,
-            total_unique_after_dedup,
-            len(apps_payload)
-        )
-
-        return ScrapeResponse(
-            category=normalized_category,
-            total_raw_collected=total_raw_collected,
-            total_unique_after_dedup=total_unique_after_dedup,
-            total_returned=len(apps_payload),
-            apps=apps_payload
-        )
+        return await _scrape_impl(normalized_category, limit, underperforming_only)
     
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error scraping category {normalized_category}: {str(e)}")
+        logger.error("Error scraping category %s: %s", normalized_category, e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -364,30 +543,18 @@ async def scrape_category(
 
 
 @app_instance.get("/categories", tags=["Information"])
-async def list_categories():
+async def list_categories(request: Request):
     """
     Get all available categories
     """
-    app_categories = sorted(APP_CATEGORY_QUERIES.keys())
-    game_categories = sorted(GAME_CATEGORY_QUERIES.keys())
-    
-    return {
-        "total_categories": len(CATEGORY_QUERIES),
-        "app_categories": {
-            "count": len(app_categories),
-            "categories": app_categories
-        },
-        "game_categories": {
-            "count": len(game_categories),
-            "categories": game_categories
-        },
-        "usage": "Use these category names in /scrape/{category_name} endpoint"
-    }
+    return _static_response(request, _CATEGORIES_BODY, _CATEGORIES_ETAG)
 
 
 @app_instance.get(
     "/deep-scan/{keyword}",
     response_model=DeepScanResponse,
+    response_model_by_alias=True,
+    response_model_exclude_none=True,
     tags=["Deep Scan"],
     responses={
         200: {"description": "Successfully scanned and found low-rated apps"},
@@ -424,12 +591,12 @@ async def deep_scan(keyword: str):
         )
     
     keyword = keyword.strip()
-    logger.info(f"[DEEP_SCAN] Searching for keyword: '{keyword}'")
-    logger.info(f"[SEARCH_PARAMS] country='us', lang='en', n_hits=500")
+    logger.info("[DEEP_SCAN] Searching for keyword: '%s'", keyword)
+    logger.info("[SEARCH_PARAMS] country='us', lang='en', n_hits=500")
     
     try:
         # Scan with 500 hits for comprehensive deep analysis
-        results = search(
+        results = _search_cached(
             query=keyword,
             n_hits=500,
             lang='en',
@@ -454,39 +621,35 @@ async def deep_scan(keyword: str):
             )
         
         total_scanned = len(apps_list)
-        logger.info(f"[SEARCH_RESULT] TOTAL APPS FOUND: {total_scanned}")
-        logger.info(f"[FILTERING] Filtering for score >= 3.0 AND score < 4.0...")
-        
-        # Clean and filter low-rated apps (< 3.5 for testing)
-        low_rated_apps = []
+        logger.info("[SEARCH_RESULT] TOTAL APPS FOUND: %s", total_scanned)
+        logger.info("[FILTERING] Filtering for score >= 3.0 AND score < 4.0...")
         
-        for app_data in apps_list:
-            try:
-                score = app_data.get('score')
-                
-                # Filter: score >= 3.0 AND score < 4.0 (apps in 3.0-4.0 rating range)
-                if score is None or score == 0 or score < 3.0 or score >= 4.0:
-                    continue
-                
-                if score >= 3.0 and score < 4.0:
-                    low_rated_app = DeepScanAppInfo(
-                        title=app_data.get('title', 'N/A'),
-                        appId=app_data.get('appId', 'N/A'),
-                        score=score,
-                        developer=app_data.get('developer', 'N/A'),
-                        description=app_data.get('summary', app_data.get('description', None)),
-                        installs=app_data.get('installs', 'N/A')
-                    )
-                    low_rated_apps.append(low_rated_app)
-            except Exception as e:
-                logger.warning(f"[SKIP] Skipping app due to error: {str(e)}")
-                continue
+        # Filter: score >= 3.0 AND score < 4.0 (apps in 3.0-4.0 rating range),
+        # working on the raw dicts so only the survivors become models
+        get = dict.get
+        filtered = [
+            app_data for app_data in apps_list
+            if (score := get(app_data, _K_SCORE)) is not None and 3.0 <= score < 4.0
+        ]
         
         # Sort by score (ascending - worst first)
-        low_rated_apps.sort(key=lambda x: x.score)
+        filtered.sort(key=lambda app_data: app_data[_K_SCORE])
+        
+        # model_construct skips validation, so null required fields are coalesced here
+        low_rated_apps = [
+            DeepScanAppInfo.model_construct(
+                title=app_data.get(_K_TITLE) or 'N/A',
+                app_id=app_data.get(_K_APPID) or 'N/A',
+                score=app_data[_K_SCORE],
+                developer=app_data.get(_K_DEV) or 'N/A',
+                description=app_data.get(_K_SUMMARY, app_data.get(_K_DESC, None)),
+                installs=app_data.get(_K_INSTALLS, 'N/A')
+            )
+            for app_data in filtered
+        ]
         
-        logger.info(f"[FILTER_RESULT] Found {len(low_rated_apps)} apps with rating 3.0-4.0")
-        logger.info(f"[COMPLETE] Deep scan complete for '{keyword}': {len(low_rated_apps)} apps to return")
+        logger.info("[FILTER_RESULT] Found %s apps with rating 3.0-4.0", len(low_rated_apps))
+        logger.info("[COMPLETE] Deep scan complete for '%s': %s apps to return", keyword, len(low_rated_apps))
         
         return DeepScanResponse(
             keyword_searched=keyword,
@@ -498,7 +661,7 @@ async def deep_scan(keyword: str):
     except HTTPException as he:
         raise he
     except Exception as e:
-        logger.error(f"[DEEP_SCAN_ERROR] ERROR during deep scan: {str(e)}")
+        logger.error("[DEEP_SCAN_ERROR] ERROR during deep scan: %s", e)
         raise HTTPException(
             status_code=500,
             detail={
@@ -511,9 +674,15 @@ async def deep_scan(keyword: str):
 
 if __name__ == "__main__":
     import uvicorn
+    # An import string is required for multiple workers; uvloop has no Windows build.
+    # app_dir puts the repo root on sys.path so `python backend/main.py` resolves it too
     uvicorn.run(
-        app_instance,
+        "backend.main:app_instance",
+        app_dir=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
         host="0.0.0.0",
         port=8080,
-        log_level="info"
+        log_level="info",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
     )
@@ -3,19 +3,14 @@ Verify that all requirements are installed and working
 """
 
 import sys
-import importlib
+from importlib.metadata import PackageNotFoundError, version
 from typing import List, Tuple
 
-def check_package(package_name: str, import_name: str = None) -> Tuple[bool, str]:
-    """Check if a package is installed"""
-    if import_name is None:
-        import_name = package_name
-    
+def check_package(package_name: str) -> Tuple[bool, str]:
+    """Check if a package is installed (reads dist metadata, nothing is imported)"""
     try:
-        mod = importlib.import_module(import_name)
-        version = getattr(mod, '__version__', 'unknown')
-        return True, version
-    except ImportError:
+        return True, version(package_name)
+    except PackageNotFoundError:
         return False, "not installed"
 
 
@@ -25,22 +20,29 @@ def main():
     print("="*60 + "\n")
     
     requirements = [
-        ("fastapi", "fastapi"),
-        ("uvicorn", "uvicorn"),
-        ("pydantic", "pydantic"),
-        ("google-play-scraper", "google_play_scraper"),
-        ("requests", "requests"),
+        "fastapi",
+        "uvicorn",
+        "pydantic",
+        "google-play-scraper",
+        "requests",
+        "ijson",
+        "cachetools",
+        "async-lru",
+        "orjson",
+        "httptools",
     ]
+    if sys.platform != "win32":
+        requirements.append("uvloop")
     
     print(f"Python Version: {sys.version}")
     print(f"Python Executable: {sys.executable}\n")
     
     all_ok = True
     
-    for package, import_name in requirements:
-        ok, version = check_package(package, import_name)
+    for package in requirements:
+        ok, installed_version = check_package(package)
         status = "✅" if ok else "❌"
-        print(f"{status} {package:<25} {version}")
+        print(f"{status} {package:<25} {installed_version}")
         if not ok:
             all_ok = False
     